@@ -35,6 +35,19 @@ setup(
             "flake8>=6.1.0",
             "mypy>=1.7.1",
         ],
+        "cache": [
+            "requests-cache>=1.1.1",
+        ],
+        "speedups": [
+            "orjson>=3.9.10",
+            "ciso8601>=2.3.1",
+        ],
+        "streaming": [
+            "ijson>=3.2.3",
+        ],
+        "http2": [
+            "httpx[http2]>=0.25.2",
+        ],
     },
     entry_points={
         "console_scripts": [
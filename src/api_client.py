@@ -1,74 +1,225 @@
+import asyncio
+import json
 import logging
+import socket
 import time
-from typing import Dict, List, Optional, Any
+from array import array
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import aiohttp
 import requests
+from pydantic import TypeAdapter
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
 from urllib3.util.retry import Retry
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import AsyncRetrying, RetryCallState, stop_after_attempt, wait_exponential, retry_if_exception
+
+try:
+    import requests_cache
+except ImportError:  # optional dependency, only needed when the HTTP cache is enabled
+    requests_cache = None
+
+try:
+    import httpx
+    import h2  # noqa: F401  -- httpx needs it for HTTP/2
+except ImportError:  # optional dependency, only needed for the HTTP/2 detail backend
+    httpx = None
+
+try:
+    import ijson
+except ImportError:  # optional dependency, only needed for streamed page parsing
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # optional dependency, falls back to the stdlib json module
+    orjson = None
 
 import config
-from models import AnimalSummary, AnimalDetail, PaginatedResponse, TransformedAnimal, APIError
+from models import AnimalSummary, AnimalDetail, PaginatedResponse, RawPage, TransformedAnimal, APIError
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_HEADERS = {
+    'Content-Type': 'application/json',
+    'User-Agent': 'Animal-ETL/1.0'
+}
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+_TRANSFORMED_ANIMALS_ADAPTER = TypeAdapter(List[TransformedAnimal])
+
+# Error bodies are only kept for logging, so decode just the head of them.
+_ERROR_SNIPPET_BYTES = 1024
+
+
+def _error_snippet(body: bytes) -> str:
+    """Decode the first few hundred bytes of an error body for diagnostics."""
+    return body[:_ERROR_SNIPPET_BYTES].decode('utf-8', 'replace')
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds to wait."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_retryable_error(error: BaseException) -> bool:
+    """Retry transport failures and config.RETRY_STATUS_CODES, matching the sync session's policy."""
+    if not isinstance(error, APIError):
+        return False
+    return error.status_code is None or error.status_code in config.RETRY_STATUS_CODES
+
+
+def _wait_retry_after_or(backoff: Callable[[RetryCallState], float]) -> Callable[[RetryCallState], float]:
+    """tenacity wait that sleeps for the server's Retry-After when given, else uses backoff."""
+    def wait(retry_state: RetryCallState) -> float:
+        error = retry_state.outcome.exception() if retry_state.outcome else None
+        retry_after = getattr(error, 'retry_after', None)
+        if retry_after is not None:
+            return min(retry_after, config.MAX_RETRY_DELAY)
+        return backoff(retry_state)
+    return wait
+
+
+# aiohttp.ClientSession, or httpx.AsyncClient when HTTP/2 is enabled
+AsyncSession = Any
+
+# Called with (animal_id, AnimalDetail or APIError) as each detail lookup finishes
+DetailCallback = Callable[[int, Union[AnimalDetail, APIError]], None]
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets are tuned for long-lived keep-alive reuse."""
+    
+    SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', self.SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
 
 class AnimalAPIClient:
     """
     HTTP client for the Animal API with robust retry logic and error handling.
     """
     
-    def __init__(self, base_url: str = config.BASE_URL, timeout: int = config.TIMEOUT):
+    def __init__(self, base_url: str = config.BASE_URL, timeout: int = config.TIMEOUT,
+                 max_retries: int = config.MAX_RETRIES,
+                 max_concurrency: int = config.MAX_CONCURRENT_REQUESTS,
+                 enable_cache: bool = config.ENABLE_HTTP_CACHE,
+                 http2: bool = config.ENABLE_HTTP2):
         """
         Initialize the API client.
         
         Args:
             base_url: Base URL for the API
             timeout: Request timeout in seconds
+            max_retries: Maximum number of retries per request
+            max_concurrency: Maximum number of in-flight detail requests
+            enable_cache: Cache GET responses on disk (requires requests-cache)
+            http2: Fetch details over HTTP/2 with httpx (requires httpx[http2])
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
+        # Absolute URLs are built once here so the hot paths skip re-joining and format parsing
+        self._animals_list_url = self.base_url + config.ANIMALS_LIST_ENDPOINT
+        self._details_batch_url = self.base_url + config.ANIMAL_DETAILS_BATCH_ENDPOINT
+        self._home_url = self.base_url + config.HOME_ENDPOINT
+        self._detail_url_fmt = (self.base_url.replace('%', '%%')
+                                + config.ANIMAL_DETAIL_ENDPOINT.replace('{id}', '%d'))
+        self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+        self.enable_cache = enable_cache and self._cache_available()
+        self.http2 = http2 and self._http2_available()
+        if self.http2 and not self.base_url.startswith('https://'):
+            logger.info(f"HTTP/2 enabled but {self.base_url} is not https; httpx will use HTTP/1.1 "
+                        f"connections for detail requests")
         self.session = self._create_session()
+        # None until the first batch lookup tells us whether the API supports it
+        self._batch_details_supported: Optional[bool] = None
+        # Optional per-instance memo of fetched details (config.DETAIL_CACHE_SIZE, off by default)
+        # for callers that look the same animal up more than once on one client
+        self._detail_cache: 'OrderedDict[int, AnimalDetail]' = OrderedDict()
+    
+    @staticmethod
+    def _cache_available() -> bool:
+        """Check whether the optional requests-cache dependency is installed."""
+        if requests_cache is None:
+            logger.warning("HTTP cache requested but requests-cache is not installed; caching disabled")
+            return False
+        return True
+    
+    @staticmethod
+    def _http2_available() -> bool:
+        """Check whether the optional httpx[http2] dependency is installed."""
+        if httpx is None:
+            logger.warning("HTTP/2 requested but httpx[http2] is not installed; using aiohttp")
+            return False
+        return True
     
     def _create_session(self) -> requests.Session:
         """Create a requests session with connection pooling and basic retry strategy."""
-        session = requests.Session()
+        if self.enable_cache:
+            # Only GETs are cached; submissions to the home endpoint always hit the API
+            session = requests_cache.CachedSession(
+                config.HTTP_CACHE_NAME,
+                backend='sqlite',
+                expire_after=config.HTTP_CACHE_EXPIRE_AFTER,
+                allowable_methods=('GET',)
+            )
+        else:
+            session = requests.Session()
         
-        # Configure connection pooling and basic retries for connection errors
+        # Retries for connection errors and retryable statuses happen inside urllib3,
+        # backing off exponentially and honouring any Retry-After header
         retry_strategy = Retry(
-            total=3,
-            connect=3,
-            read=3,
-            backoff_factor=0.3,
-            status_forcelist=[],
+            total=self.max_retries,
+            backoff_factor=config.INITIAL_RETRY_DELAY,
+            backoff_max=config.MAX_RETRY_DELAY,
+            status_forcelist=config.RETRY_STATUS_CODES,
+            allowed_methods=frozenset(['GET', 'POST']),
+            raise_on_status=False,
+            respect_retry_after_header=True,
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=10, pool_maxsize=20)
+        # Size the pool so concurrent workers always find an idle keep-alive
+        # connection instead of opening (and later discarding) a new one
+        pool_size = max(config.MAX_CONCURRENT_REQUESTS, config.MAX_PAGE_WORKERS, config.MAX_SUBMIT_WORKERS)
+        adapter = _KeepAliveAdapter(
+            max_retries=retry_strategy,
+            pool_connections=pool_size,
+            pool_maxsize=pool_size * 2,
+            pool_block=False
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
-        session.headers.update({
-            'Content-Type': 'application/json',
-            'User-Agent': 'Animal-ETL/1.0'
-        })
+        session.headers.update(_DEFAULT_HEADERS)
+        session.headers['Connection'] = 'keep-alive'
         
         return session
     
-    @retry(
-        stop=stop_after_attempt(config.MAX_RETRIES),
-        wait=wait_exponential(
-            multiplier=config.INITIAL_RETRY_DELAY,
-            max=config.MAX_RETRY_DELAY
-        ),
-        retry=retry_if_exception_type((requests.RequestException, APIError)),
-        reraise=True
-    )
     def _make_request(self, method: str, url: str, **kwargs) -> requests.Response:
         """
-        Make an HTTP request with automatic retry logic.
+        Make an HTTP request; retries are handled by the session's urllib3 adapter.
         
         Args:
             method: HTTP method (GET, POST, etc.)
-            url: Request URL
+            url: Request URL, either absolute or relative to base_url
             **kwargs: Additional arguments for requests
             
         Returns:
@@ -77,48 +228,40 @@ class AnimalAPIClient:
         Raises:
             APIError: For HTTP errors or API-specific issues
         """
-        full_url = f"{self.base_url}{url}"
+        full_url = url if url.startswith(('http://', 'https://')) else f"{self.base_url}{url}"
         
         try:
-            logger.debug(f"Making {method} request to {full_url}")
+            logger.debug("Making %s request to %s", method, full_url)
             response = self.session.request(
                 method=method,
                 url=full_url,
                 timeout=self.timeout,
                 **kwargs
             )
-
-            if response.status_code in config.RETRY_STATUS_CODES:
-                logger.warning(f"Received retryable error {response.status_code} from {full_url}")
-                raise APIError(
-                    f"HTTP {response.status_code} error",
-                    status_code=response.status_code,
-                    response_text=response.text
-                )
-
-            response.raise_for_status()
-            
-            logger.debug(f"Successfully received response from {full_url}")
-            return response
-            
         except requests.Timeout:
             logger.warning(f"Request timeout for {full_url}")
             raise APIError(f"Request timeout for {full_url}")
         except requests.ConnectionError as e:
             logger.warning(f"Connection error for {full_url}: {str(e)}")
             raise APIError(f"Connection error: {str(e)}")
-        except requests.HTTPError as e:
-            if e.response.status_code not in config.RETRY_STATUS_CODES:
-                logger.error(f"Non-retryable HTTP error {e.response.status_code} for {full_url}")
-                raise APIError(
-                    f"HTTP {e.response.status_code} error",
-                    status_code=e.response.status_code,
-                    response_text=e.response.text
-                )
-            raise 
         except requests.RequestException as e:
             logger.warning(f"Request error for {full_url}: {str(e)}")
             raise APIError(f"Request error: {str(e)}")
+
+        if response.status_code >= 400:
+            if response.status_code in config.RETRY_STATUS_CODES:
+                logger.warning(f"Retries exhausted for HTTP {response.status_code} from {full_url}")
+            else:
+                logger.error(f"Non-retryable HTTP error {response.status_code} for {full_url}")
+            raise APIError(
+                f"HTTP {response.status_code} error",
+                status_code=response.status_code,
+                response_text=_error_snippet(response.content),
+                retry_after=_parse_retry_after(response.headers.get('Retry-After'))
+            )
+        
+        logger.debug("Successfully received response from %s", full_url)
+        return response
     
     def get_animals_page(self, page: int = 1, page_size: int = config.DEFAULT_PAGE_SIZE) -> PaginatedResponse:
         """
@@ -137,11 +280,10 @@ class AnimalAPIClient:
         params = {'page': page, 'per_page': page_size}
         
         try:
-            response = self._make_request('GET', config.ANIMALS_LIST_ENDPOINT, params=params)
-            data = response.json()
+            response = self._make_request('GET', self._animals_list_url, params=params)
             
-            # Validate and parse the response
-            return PaginatedResponse(**data)
+            # Decode and validate the raw body in one pass inside pydantic-core
+            return PaginatedResponse.model_validate_json(response.content)
             
         except (ValueError, KeyError) as e:
             logger.error(f"Failed to parse animals list response: {str(e)}")
@@ -151,33 +293,187 @@ class AnimalAPIClient:
         """
         Get all animals by paginating through the list endpoint.
         
+        The first page is fetched on its own to learn total_pages; the
+        remaining pages are then fetched concurrently.
+        
         Returns:
-            List of all AnimalSummary objects
+            List of all AnimalSummary objects, in page order
             
         Raises:
             APIError: If any request fails
         """
         all_animals = []
-        current_page = config.START_PAGE
         
         logger.info("Starting to fetch all animals...")
         
-        while True:
-            logger.debug(f"Fetching page {current_page}")
-            page_response = self.get_animals_page(current_page)
+        first_page = self.get_animals_page(config.START_PAGE)
+        all_animals.extend(first_page.items)
+        logger.info(f"Fetched page {config.START_PAGE}: {len(first_page.items)} animals "
+                   f"(total pages: {first_page.total_pages})")
+        
+        remaining_pages = range(config.START_PAGE + 1, first_page.total_pages + 1)
+        if remaining_pages:
+            max_workers = min(config.MAX_PAGE_WORKERS, len(remaining_pages))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # map() yields results in submission order, so items stay in page order
+                for current_page, page_response in zip(remaining_pages,
+                                                       executor.map(self.get_animals_page, remaining_pages)):
+                    all_animals.extend(page_response.items)
+                    logger.info(f"Fetched page {current_page}: {len(page_response.items)} animals "
+                               f"(total so far: {len(all_animals)})")
+        
+        logger.info(f"Finished fetching all animals: {len(all_animals)} total")
+        return all_animals
+    
+    def get_animals_page_raw(self, page: int = 1, page_size: int = config.DEFAULT_PAGE_SIZE) -> RawPage:
+        """
+        Get a page of animals from the list endpoint without model validation.
+        
+        Only the pagination fields are checked; items are returned as the
+        decoded dicts, so no AnimalSummary models are built.
+        
+        Args:
+            page: Page number (1-based)
+            page_size: Number of items per page
             
-            all_animals.extend(page_response.items)
+        Returns:
+            RawPage with the page number, total pages and raw item dicts
             
-            logger.info(f"Fetched page {current_page}: {len(page_response.items)} animals "
-                       f"(total so far: {len(all_animals)})")
-
-            if current_page >= page_response.total_pages:
-                break
+        Raises:
+            APIError: If the request fails or the response is malformed
+        """
+        params = {'page': page, 'per_page': page_size}
+        response = self._make_request('GET', self._animals_list_url, params=params)
+        
+        try:
+            data = _json_loads(response.content)
+            raw_page = RawPage(data['page'], data['total_pages'], data['items'])
+            if raw_page.page < 1 or raw_page.total_pages < 1:
+                raise ValueError(f"page={raw_page.page}, total_pages={raw_page.total_pages} must be >= 1")
+        except (ValueError, KeyError, TypeError) as e:
+            logger.error(f"Failed to parse animals list response: {str(e)}")
+            raise APIError(f"Invalid response format: {str(e)}")
+        
+        return raw_page
+    
+    def _get_page_ids(self, page: int, page_size: int = config.DEFAULT_PAGE_SIZE) -> Tuple[int, array]:
+        """
+        Get the animal IDs on one page of the list endpoint.
+        
+        Uses the raw page unless config.STRICT_PAGE_VALIDATION asks for every
+        item to be validated as an AnimalSummary.
+        
+        Args:
+            page: Page number (1-based)
+            page_size: Number of items per page
+            
+        Returns:
+            Tuple of (total_pages, IDs on the page)
             
-            current_page += 1
+        Raises:
+            APIError: If the request fails or the response is malformed
+        """
+        if config.STRICT_PAGE_VALIDATION:
+            page_response = self.get_animals_page(page, page_size)
+            return page_response.total_pages, array('q', [item.id for item in page_response.items])
         
-        logger.info(f"Finished fetching all animals: {len(all_animals)} total")
-        return all_animals
+        # Cached responses are already in memory, and their raw body cannot be re-read as a stream
+        if config.STREAM_PAGE_PARSING and ijson is not None and not self.enable_cache:
+            meta: Dict[str, int] = {}
+            page_ids = array('q', self._iter_page_ids_streamed(page, page_size, meta))
+            return meta['total_pages'], page_ids
+        
+        raw_page = self.get_animals_page_raw(page, page_size)
+        try:
+            return raw_page.total_pages, array('q', [item['id'] for item in raw_page.items])
+        except (KeyError, TypeError, OverflowError) as e:
+            logger.error(f"Failed to parse animals list response: {str(e)}")
+            raise APIError(f"Invalid response format: {str(e)}")
+    
+    def _iter_page_ids_streamed(self, page: int, page_size: int,
+                                meta: Dict[str, int]) -> Iterator[int]:
+        """
+        Yield the animal IDs on one page while its body is still being received.
+        
+        The body is parsed incrementally with ijson, so memory stays flat no
+        matter how large the page is. The page's pagination fields are
+        stored in meta once the generator is exhausted.
+        
+        Args:
+            page: Page number (1-based)
+            page_size: Number of items per page
+            meta: Dict that receives 'page' and 'total_pages'
+            
+        Yields:
+            Animal IDs, in page order
+            
+        Raises:
+            APIError: If the request fails or the response is malformed
+        """
+        params = {'page': page, 'per_page': page_size}
+        response = self._make_request('GET', self._animals_list_url, params=params, stream=True)
+        response.raw.decode_content = True
+        
+        items = ids = 0
+        try:
+            for prefix, event, value in ijson.parse(response.raw):
+                if prefix == 'items.item.id' and event == 'number':
+                    # ijson yields Decimal for non-integers; reject them as the buffered path does
+                    if type(value) is not int:
+                        raise ValueError(f"animal id {value} is not an integer")
+                    ids += 1
+                    yield value
+                elif prefix == 'items.item' and event == 'start_map':
+                    items += 1
+                elif prefix in ('page', 'total_pages') and event == 'number':
+                    if type(value) is not int:
+                        raise ValueError(f"{prefix} {value} is not an integer")
+                    meta[prefix] = value
+            if items != ids:
+                raise ValueError(f"{items - ids} of {items} items have no numeric id")
+            if meta.get('page', 0) < 1 or meta.get('total_pages', 0) < 1:
+                raise ValueError(f"page={meta.get('page')}, total_pages={meta.get('total_pages')} must be >= 1")
+        except (ijson.JSONError, ValueError) as e:
+            logger.error(f"Failed to parse animals list response: {str(e)}")
+            raise APIError(f"Invalid response format: {str(e)}")
+        except (Urllib3HTTPError, requests.RequestException) as e:
+            # ijson reads urllib3's raw stream, so body errors surface unwrapped by requests
+            logger.warning(f"Connection error reading animals list response: {str(e)}")
+            raise APIError(f"Connection error: {str(e)}")
+        finally:
+            response.close()
+    
+    def get_all_animal_ids(self) -> array:
+        """
+        Get the IDs of all animals by paginating through the list endpoint.
+        
+        Like get_all_animals, the first page is fetched on its own to learn
+        total_pages and the rest are fetched concurrently.
+        
+        Returns:
+            Contiguous array of animal IDs, in page order
+            
+        Raises:
+            APIError: If any request fails
+        """
+        logger.info("Starting to fetch all animal IDs...")
+        
+        total_pages, animal_ids = self._get_page_ids(config.START_PAGE)
+        logger.info(f"Fetched page {config.START_PAGE}: {len(animal_ids)} animals "
+                   f"(total pages: {total_pages})")
+        
+        remaining_pages = range(config.START_PAGE + 1, total_pages + 1)
+        if remaining_pages:
+            max_workers = min(config.MAX_PAGE_WORKERS, len(remaining_pages))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for current_page, (_, page_ids) in zip(remaining_pages,
+                                                       executor.map(self._get_page_ids, remaining_pages)):
+                    animal_ids.extend(page_ids)
+                    logger.info(f"Fetched page {current_page}: {len(page_ids)} animals "
+                               f"(total so far: {len(animal_ids)})")
+        
+        logger.info(f"Finished fetching all animal IDs: {len(animal_ids)} total")
+        return animal_ids
     
     def get_animal_detail(self, animal_id: int) -> AnimalDetail:
         """
@@ -192,54 +488,442 @@ class AnimalAPIClient:
         Raises:
             APIError: If the request fails
         """
-        url = config.ANIMAL_DETAIL_ENDPOINT.format(id=animal_id)
+        cached = self._cached_detail(animal_id)
+        if cached is not None:
+            return cached
+        
+        url = self._detail_url_fmt % animal_id
         
         try:
             response = self._make_request('GET', url)
-            data = response.json()
             
-            # Validate and parse the response
-            return AnimalDetail(**data)
+            # Decode and validate the raw body in one pass inside pydantic-core
+            detail = AnimalDetail.model_validate_json(response.content)
             
         except (ValueError, KeyError) as e:
             logger.error(f"Failed to parse animal detail response for ID {animal_id}: {str(e)}")
             raise APIError(f"Invalid response format for animal {animal_id}: {str(e)}")
+        
+        self._remember_detail(animal_id, detail)
+        return detail
+    
+    def _cached_detail(self, animal_id: int) -> Optional[AnimalDetail]:
+        """Return a memoised detail, marking it most recently used, or None on a miss."""
+        try:
+            self._detail_cache.move_to_end(animal_id)
+        except KeyError:
+            return None
+        return self._detail_cache.get(animal_id)
+    
+    def _remember_detail(self, animal_id: int, detail: AnimalDetail) -> None:
+        """Store a fetched detail, evicting the least recently used entry once the cache is full."""
+        if config.DETAIL_CACHE_SIZE <= 0:
+            return
+        if len(self._detail_cache) >= config.DETAIL_CACHE_SIZE:
+            self._detail_cache.popitem(last=False)
+        self._detail_cache[animal_id] = detail
     
-    def get_all_animal_details(self, animal_summaries: List[AnimalSummary]) -> List[AnimalDetail]:
+    def get_animal_details_batch(self, animal_ids: Sequence[int]) -> Optional[List[AnimalDetail]]:
         """
-        Get detailed information for all animals.
+        Get detailed information for many animals with one request per chunk of IDs.
+        
+        IDs are sent in chunks of config.DETAIL_BATCH_SIZE as an ``ids`` query
+        parameter. If the API does not support batch lookups (404/405 on the
+        route, a failed first request, or a response that is not a list of
+        animals), the client remembers that and returns None so callers can
+        fall back to per-ID requests.
         
         Args:
-            animal_summaries: List of animal summaries from the list endpoint
+            animal_ids: IDs of the animals to look up
             
         Returns:
-            List of AnimalDetail objects
+            List of AnimalDetail objects in the order of animal_ids (IDs the API
+            did not return are omitted), or None if batch lookups are unsupported
             
         Raises:
-            APIError: If any request fails
+            APIError: If a batch request fails for any other reason
         """
-        animal_details = []
-        total_animals = len(animal_summaries)
+        if self._batch_details_supported is False:
+            return None
         
-        logger.info(f"Starting to fetch details for {total_animals} animals...")
+        details_by_id: Dict[int, AnimalDetail] = {}
         
-        for i, animal_summary in enumerate(animal_summaries, 1):
-            logger.debug(f"Fetching details for animal {animal_summary.id} ({i}/{total_animals})")
+        for i in range(0, len(animal_ids), config.DETAIL_BATCH_SIZE):
+            chunk = animal_ids[i:i + config.DETAIL_BATCH_SIZE]
+            params = {'ids': ','.join(map(str, chunk))}
             
             try:
-                detail = self.get_animal_detail(animal_summary.id)
-                animal_details.append(detail)
-                
-                if i % 10 == 0:
-                    logger.info(f"Fetched details for {i}/{total_animals} animals")
-                    
+                response = self._make_request('GET', self._details_batch_url, params=params)
+                data = _json_loads(response.content)
             except APIError as e:
-                logger.error(f"Failed to fetch details for animal {animal_summary.id}: {str(e)}")
+                if e.status_code in (404, 405):
+                    return self._disable_batch_details(f"HTTP {e.status_code}")
+                if self._batch_details_supported is None:
+                    # The probe itself failed; don't pay for it again on every run
+                    return self._disable_batch_details(str(e))
                 raise
+            except ValueError as e:
+                raise APIError(f"Invalid batch detail response format: {str(e)}")
+            
+            if not isinstance(data, list):
+                return self._disable_batch_details("response is not a list of animals")
+            
+            try:
+                for item in data:
+                    detail = AnimalDetail(**item)
+                    details_by_id[detail.id] = detail
+            except (ValueError, KeyError, TypeError) as e:
+                logger.error(f"Failed to parse batch detail response: {str(e)}")
+                raise APIError(f"Invalid batch detail response format: {str(e)}")
+            
+            self._batch_details_supported = True
+            logger.info(f"Fetched details for {len(details_by_id)}/{len(animal_ids)} animals in batches")
         
-        logger.info(f"Finished fetching details for all {len(animal_details)} animals")
+        return [details_by_id[animal_id] for animal_id in animal_ids if animal_id in details_by_id]
+    
+    def _disable_batch_details(self, reason: str) -> None:
+        """Record that the API does not support batch detail lookups."""
+        logger.info(f"Batch detail lookups not supported ({reason}); using per-animal requests")
+        self._batch_details_supported = False
+        return None
+    
+    async def _fetch_detail_async(self, session: AsyncSession,
+                                  semaphore: asyncio.Semaphore, animal_id: int) -> bytes:
+        """
+        Fetch the raw detail payload for an animal with automatic retry logic.
+        
+        aiohttp has no equivalent of urllib3's Retry, so the async path
+        retries with tenacity using the same budget, backoff settings and
+        retryable statuses (transport errors and config.RETRY_STATUS_CODES),
+        sleeping for the server's Retry-After instead when one is sent.
+        
+        Args:
+            session: Shared aiohttp session or httpx client
+            semaphore: Semaphore bounding the number of in-flight requests
+            animal_id: The animal's ID
+            
+        Returns:
+            Raw response body
+            
+        Raises:
+            APIError: For HTTP errors or connection issues
+        """
+        fetch_once = self._fetch_detail_once_http2 if self.http2 else self._fetch_detail_once_async
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(self.max_retries + 1),
+            wait=_wait_retry_after_or(wait_exponential(
+                multiplier=config.INITIAL_RETRY_DELAY,
+                max=config.MAX_RETRY_DELAY
+            )),
+            retry=retry_if_exception(_is_retryable_error),
+            reraise=True
+        )
+        async for attempt in retrying:
+            with attempt:
+                return await fetch_once(session, semaphore, animal_id)
+    
+    async def _fetch_detail_once_async(self, session: aiohttp.ClientSession,
+                                       semaphore: asyncio.Semaphore, animal_id: int) -> bytes:
+        """
+        Make a single attempt at fetching the raw detail payload for an animal.
+        
+        The semaphore is acquired per attempt so that backoff sleeps do not
+        hold one of the in-flight request slots.
+        
+        Args:
+            session: Shared aiohttp session
+            semaphore: Semaphore bounding the number of in-flight requests
+            animal_id: The animal's ID
+            
+        Returns:
+            Raw response body
+            
+        Raises:
+            APIError: For HTTP errors or connection issues
+        """
+        full_url = self._detail_url_fmt % animal_id
+        
+        async with semaphore:
+            try:
+                async with session.get(full_url) as response:
+                    if response.status >= 400:
+                        if response.status in config.RETRY_STATUS_CODES:
+                            logger.warning(f"Received retryable error {response.status} from {full_url}")
+                        else:
+                            logger.error(f"Non-retryable HTTP error {response.status} for {full_url}")
+                        raise APIError(
+                            f"HTTP {response.status} error",
+                            status_code=response.status,
+                            response_text=_error_snippet(await response.read()),
+                            retry_after=_parse_retry_after(response.headers.get('Retry-After'))
+                        )
+                    return await response.read()
+                    
+            except asyncio.TimeoutError:
+                logger.warning(f"Request timeout for {full_url}")
+                raise APIError(f"Request timeout for {full_url}")
+            except aiohttp.ClientError as e:
+                logger.warning(f"Connection error for {full_url}: {str(e)}")
+                raise APIError(f"Connection error: {str(e)}")
+    
+    async def _fetch_detail_once_http2(self, session: AsyncSession,
+                                       semaphore: asyncio.Semaphore, animal_id: int) -> bytes:
+        """
+        Make a single attempt at fetching the raw detail payload over the httpx client.
+        
+        Same contract as _fetch_detail_once_async. Over https, httpx negotiates
+        HTTP/2 and in-flight requests are streams on a shared connection; over
+        plain http it has no HTTP/2 upgrade and falls back to a pool of
+        HTTP/1.1 connections.
+        
+        Args:
+            session: Shared httpx client
+            semaphore: Semaphore bounding the number of in-flight requests
+            animal_id: The animal's ID
+            
+        Returns:
+            Raw response body
+            
+        Raises:
+            APIError: For HTTP errors or connection issues
+        """
+        full_url = self._detail_url_fmt % animal_id
+        
+        async with semaphore:
+            try:
+                response = await session.get(full_url)
+            except httpx.TimeoutException:
+                logger.warning(f"Request timeout for {full_url}")
+                raise APIError(f"Request timeout for {full_url}")
+            except httpx.HTTPError as e:
+                logger.warning(f"Connection error for {full_url}: {str(e)}")
+                raise APIError(f"Connection error: {str(e)}")
+        
+        if response.status_code >= 400:
+            if response.status_code in config.RETRY_STATUS_CODES:
+                logger.warning(f"Received retryable error {response.status_code} from {full_url}")
+            else:
+                logger.error(f"Non-retryable HTTP error {response.status_code} for {full_url}")
+            raise APIError(
+                f"HTTP {response.status_code} error",
+                status_code=response.status_code,
+                response_text=_error_snippet(response.content),
+                retry_after=_parse_retry_after(response.headers.get('Retry-After'))
+            )
+        return response.content
+    
+    def _open_async_session(self) -> AsyncSession:
+        """Create the async client for a detail fan-out, sized to max_concurrency."""
+        if self.http2:
+            return httpx.AsyncClient(
+                http2=True,
+                timeout=self.timeout,
+                headers=_DEFAULT_HEADERS,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                    keepalive_expiry=config.KEEPALIVE_TIMEOUT
+                )
+            )
+        
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrency,
+            limit_per_host=self.max_concurrency,
+            keepalive_timeout=config.KEEPALIVE_TIMEOUT
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers=_DEFAULT_HEADERS
+        )
+    
+    async def _get_detail_async(self, session: AsyncSession,
+                                semaphore: asyncio.Semaphore, animal_id: int) -> AnimalDetail:
+        """
+        Get detailed information for a specific animal over the async session.
+        
+        Args:
+            session: Shared aiohttp session or httpx client
+            semaphore: Semaphore bounding the number of in-flight requests
+            animal_id: The animal's ID
+            
+        Returns:
+            AnimalDetail object
+            
+        Raises:
+            APIError: If the request fails
+        """
+        cached = self._cached_detail(animal_id)
+        if cached is not None:
+            return cached
+        
+        body = await self._fetch_detail_async(session, semaphore, animal_id)
+        
+        try:
+            detail = AnimalDetail.model_validate_json(body)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.error(f"Failed to parse animal detail response for ID {animal_id}: {str(e)}")
+            raise APIError(f"Invalid response format for animal {animal_id}: {str(e)}")
+        
+        self._remember_detail(animal_id, detail)
+        return detail
+    
+    async def get_animal_details_by_id_async(self, animal_ids: Sequence[int],
+                                             return_exceptions: bool = False,
+                                             on_result: Optional[DetailCallback] = None) -> List[AnimalDetail]:
+        """
+        Get detailed information for the given animals concurrently.
+        
+        Requests share one keep-alive connection pool (or, with http2 against
+        an https API, multiplexed HTTP/2 connections) and at most
+        ``max_concurrency`` of them are in flight at any time.
+        
+        Args:
+            animal_ids: IDs of the animals to look up
+            return_exceptions: If True, failed lookups are returned in place of
+                their AnimalDetail instead of aborting the whole run
+            on_result: Optional callback invoked as each lookup completes, so
+                callers can start processing before the whole set is fetched;
+                successful lookups are then handed only to the callback and
+                appear as None in the returned list
+            
+        Returns:
+            List of AnimalDetail objects, in the same order as animal_ids
+            
+        Raises:
+            APIError: If any request fails and return_exceptions is False
+        """
+        total_animals = len(animal_ids)
+        completed = 0
+        # Checked once so the per-animal debug line costs nothing when DEBUG is off
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        
+        logger.info(f"Starting to fetch details for {total_animals} animals...")
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async with self._open_async_session() as session:
+            
+            async def fetch(animal_id: int) -> Optional[AnimalDetail]:
+                nonlocal completed
+                if debug_enabled:
+                    logger.debug("Fetching details for animal %d", animal_id)
+                try:
+                    detail = await self._get_detail_async(session, semaphore, animal_id)
+                except APIError as e:
+                    logger.error(f"Failed to fetch details for animal {animal_id}: {str(e)}")
+                    if on_result is not None:
+                        on_result(animal_id, e)
+                    raise
+                else:
+                    if on_result is not None:
+                        # The callback owns the result; don't keep every detail alive in gather()
+                        on_result(animal_id, detail)
+                        return None
+                    return detail
+                finally:
+                    completed += 1
+                    if completed % 10 == 0:
+                        logger.info(f"Fetched details for {completed}/{total_animals} animals")
+            
+            animal_details = await asyncio.gather(
+                *(fetch(animal_id) for animal_id in animal_ids),
+                return_exceptions=return_exceptions
+            )
+        
+        logger.info(f"Finished fetching details for {total_animals} animals")
         return animal_details
     
+    async def get_all_animal_details_async(self, animal_summaries: List[AnimalSummary],
+                                           return_exceptions: bool = False,
+                                           on_result: Optional[DetailCallback] = None) -> List[AnimalDetail]:
+        """
+        Get detailed information for all animals concurrently.
+        
+        Kept for callers holding AnimalSummary objects; see
+        get_animal_details_by_id_async.
+        """
+        return await self.get_animal_details_by_id_async(
+            [animal_summary.id for animal_summary in animal_summaries], return_exceptions, on_result
+        )
+    
+    def get_animal_details_by_id(self, animal_ids: Sequence[int],
+                                 return_exceptions: bool = False,
+                                 on_result: Optional[DetailCallback] = None) -> List[AnimalDetail]:
+        """
+        Get detailed information for the given animals.
+        
+        Synchronous wrapper around get_animal_details_by_id_async.
+        
+        Args:
+            animal_ids: IDs of the animals to look up
+            return_exceptions: If True, failed lookups are returned in place of
+                their AnimalDetail instead of aborting the whole run
+            on_result: Optional callback invoked as each lookup completes
+                (successful lookups then appear as None in the returned list)
+            
+        Returns:
+            List of AnimalDetail objects
+            
+        Raises:
+            APIError: If any request fails and return_exceptions is False
+        """
+        if self.enable_cache:
+            return self._get_animal_details_cached(animal_ids, return_exceptions, on_result)
+        return asyncio.run(self.get_animal_details_by_id_async(animal_ids, return_exceptions, on_result))
+    
+    def get_all_animal_details(self, animal_summaries: List[AnimalSummary],
+                               return_exceptions: bool = False,
+                               on_result: Optional[DetailCallback] = None) -> List[AnimalDetail]:
+        """
+        Get detailed information for all animals.
+        
+        Kept for callers holding AnimalSummary objects; see
+        get_animal_details_by_id.
+        """
+        return self.get_animal_details_by_id(
+            [animal_summary.id for animal_summary in animal_summaries], return_exceptions, on_result
+        )
+    
+    def _get_animal_details_cached(self, animal_ids: Sequence[int],
+                                   return_exceptions: bool = False,
+                                   on_result: Optional[DetailCallback] = None) -> List[AnimalDetail]:
+        """
+        Get detailed information for the given animals through the cached session.
+        
+        Args:
+            animal_ids: IDs of the animals to look up
+            return_exceptions: If True, failed lookups are returned in place of
+                their AnimalDetail instead of aborting the whole run
+            on_result: Optional callback invoked as each lookup completes
+                (successful lookups then appear as None in the returned list)
+            
+        Returns:
+            List of AnimalDetail objects, in the same order as animal_ids
+            
+        Raises:
+            APIError: If any request fails and return_exceptions is False
+        """
+        def fetch(animal_id: int):
+            try:
+                detail = self.get_animal_detail(animal_id)
+            except APIError as e:
+                logger.error(f"Failed to fetch details for animal {animal_id}: {str(e)}")
+                if on_result is not None:
+                    on_result(animal_id, e)
+                if return_exceptions:
+                    return e
+                raise
+            if on_result is not None:
+                on_result(animal_id, detail)
+                return None
+            return detail
+        
+        logger.info(f"Fetching details for {len(animal_ids)} animals through the HTTP cache...")
+        
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            return list(executor.map(fetch, animal_ids))
+    
     def submit_animals_batch(self, animals: List[TransformedAnimal]) -> bool:
         """
         Submit a batch of transformed animals to the home endpoint.
@@ -257,11 +941,13 @@ class AnimalAPIClient:
         if len(animals) > 100:
             raise ValueError(f"Batch size {len(animals)} exceeds maximum of 100")
 
-        animals_data = [animal.dict() for animal in animals]
+        # Serialise straight from the models to JSON bytes, without intermediate dicts
+        payload = _TRANSFORMED_ANIMALS_ADAPTER.dump_json(animals)
         
         try:
             logger.info(f"Submitting batch of {len(animals)} animals")
-            response = self._make_request('POST', config.HOME_ENDPOINT, json=animals_data)
+            response = self._make_request('POST', self._home_url, data=payload,
+                                          headers={'Content-Type': 'application/json'})
             
             logger.info(f"Successfully submitted batch of {len(animals)} animals")
             return True
@@ -271,7 +957,8 @@ class AnimalAPIClient:
             raise
     
     def close(self):
-        """Close the HTTP session."""
+        """Close the HTTP session and drop cached details."""
+        self._detail_cache.clear()
         if self.session:
             self.session.close()
     
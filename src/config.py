@@ -6,6 +6,7 @@ BASE_URL = os.getenv("API_BASE_URL", "http://localhost:3123")
 ANIMALS_LIST_ENDPOINT = "/animals/v1/animals"
 ANIMAL_DETAIL_ENDPOINT = "/animals/v1/animals/{id}"
 HOME_ENDPOINT = "/animals/v1/home"
+ANIMAL_DETAILS_BATCH_ENDPOINT = ANIMALS_LIST_ENDPOINT
 
 # Processing Configuration
 BATCH_SIZE = int(os.getenv("BATCH_SIZE", "100"))
@@ -14,8 +15,37 @@ TIMEOUT = int(os.getenv("TIMEOUT", "30"))
 INITIAL_RETRY_DELAY = float(os.getenv("INITIAL_RETRY_DELAY", "1.0"))
 MAX_RETRY_DELAY = float(os.getenv("MAX_RETRY_DELAY", "60.0"))
 
+# Concurrency Configuration
+MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "64"))
+KEEPALIVE_TIMEOUT = float(os.getenv("KEEPALIVE_TIMEOUT", "30"))
+MAX_PAGE_WORKERS = int(os.getenv("MAX_PAGE_WORKERS", "16"))
+MAX_SUBMIT_WORKERS = int(os.getenv("MAX_SUBMIT_WORKERS", "8"))
+# Worker processes for parsing born_at in large detail lists (0 parses serially).
+# Only the dry run transforms a whole list at once; the pipelined run transforms each
+# detail as it arrives and always parses in-process.
+TRANSFORM_WORKERS = int(os.getenv("TRANSFORM_WORKERS", "0"))
+# Multiplex async detail requests over HTTP/2 with httpx instead of aiohttp (requires httpx[http2])
+# HTTP/2 is only negotiated for https base URLs; plain http stays on HTTP/1.1
+ENABLE_HTTP2 = os.getenv("ENABLE_HTTP2", "false").lower() in ("1", "true", "yes")
+
+# Batch Detail Lookup Configuration
+# Off by default: the animals API has no batch detail route, so the probe only costs a
+# retried request per run before falling back to per-animal lookups.
+ENABLE_DETAIL_BATCH = os.getenv("ENABLE_DETAIL_BATCH", "false").lower() in ("1", "true", "yes")
+DETAIL_BATCH_SIZE = int(os.getenv("DETAIL_BATCH_SIZE", "50"))
+
+# HTTP Cache Configuration
+ENABLE_HTTP_CACHE = os.getenv("ENABLE_HTTP_CACHE", "false").lower() in ("1", "true", "yes")
+HTTP_CACHE_NAME = os.getenv("HTTP_CACHE_NAME", "animal_cache")
+HTTP_CACHE_EXPIRE_AFTER = int(os.getenv("HTTP_CACHE_EXPIRE_AFTER", "3600"))
+# In-process memo of fetched details per client (0 disables it). Off by default: a
+# run fetches each ID once, and memoised details would outlive their transform.
+DETAIL_CACHE_SIZE = int(os.getenv("DETAIL_CACHE_SIZE", "0"))
+# JSON file that keeps parsed born_at values between runs (empty disables it)
+BORN_AT_CACHE_FILE = os.getenv("BORN_AT_CACHE_FILE", "")
+
 # HTTP Status Codes to Retry
-RETRY_STATUS_CODES: List[int] = [500, 502, 503, 504]
+RETRY_STATUS_CODES: List[int] = [429, 500, 502, 503, 504]
 
 # Logging Configuration
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
@@ -23,4 +53,8 @@ LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
 # Pagination Configuration
 DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", "20"))
-START_PAGE = int(os.getenv("START_PAGE", "1"))
\ No newline at end of file
+START_PAGE = int(os.getenv("START_PAGE", "1"))
+# Validate every list item as an AnimalSummary instead of reading raw IDs
+STRICT_PAGE_VALIDATION = os.getenv("STRICT_PAGE_VALIDATION", "false").lower() in ("1", "true", "yes")
+# Stream-parse list pages with ijson (when installed) instead of buffering each body
+STREAM_PAGE_PARSING = os.getenv("STREAM_PAGE_PARSING", "false").lower() in ("1", "true", "yes")
@@ -1,17 +1,26 @@
 import logging
+import queue
+import sys
 import time
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence
 from dataclasses import dataclass
 
 import config
 from api_client import AnimalAPIClient
-from transformers import transform_animals_batch
+from transformers import load_born_at_cache, safe_transform_animal, save_born_at_cache, transform_animals_batch
 from models import AnimalSummary, AnimalDetail, TransformedAnimal, APIError, TransformationError
 
 logger = logging.getLogger(__name__)
 
+# Marks the end of a pipeline stage's output
+_END_OF_STREAM = object()
 
-@dataclass
+# dataclass(slots=True) only exists on Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class ETLStats:
     """Statistics for ETL processing."""
     total_animals_found: int = 0
@@ -88,36 +97,127 @@ class AnimalETLProcessor:
             logger.error(f"Failed to extract animals: {str(e)}")
             raise
     
+    def extract_animal_ids(self, client: AnimalAPIClient) -> Sequence[int]:
+        """
+        Extract the IDs of all animals from the API.
+        
+        Args:
+            client: API client instance
+            
+        Returns:
+            Array of animal IDs
+            
+        Raises:
+            APIError: If extraction fails
+        """
+        logger.info("Starting animal extraction...")
+        try:
+            animal_ids = client.get_all_animal_ids()
+            self.stats.total_animals_found = len(animal_ids)
+            logger.info(f"Successfully extracted {len(animal_ids)} animals")
+            return animal_ids
+        except APIError as e:
+            logger.error(f"Failed to extract animals: {str(e)}")
+            raise
+    
     def extract_animal_details(self, client: AnimalAPIClient, 
                              animal_summaries: List[AnimalSummary]) -> List[AnimalDetail]:
         """
         Extract detailed information for all animals.
         
+        Kept for callers holding AnimalSummary objects; see
+        extract_animal_details_by_id.
+        """
+        return self.extract_animal_details_by_id(client, [summary.id for summary in animal_summaries])
+    
+    def extract_animal_details_by_id(self, client: AnimalAPIClient,
+                                     animal_ids: Sequence[int]) -> List[AnimalDetail]:
+        """
+        Extract detailed information for the given animals.
+        
         Args:
             client: API client instance
-            animal_summaries: List of animal summaries
+            animal_ids: IDs of the animals to look up
             
         Returns:
-            List of animal details
+            List of animal details, in the order they were received
         """
         logger.info("Starting animal detail extraction...")
         animal_details = []
+        self._stream_animal_details(client, animal_ids, animal_details.append)
+        return animal_details
+    
+    def _stream_animal_details(self, client: AnimalAPIClient, animal_ids: Sequence[int],
+                               emit: Callable[[AnimalDetail], None]) -> None:
+        """
+        Fetch details for the given animals, handing each one to emit as soon as it arrives.
+        
+        The batch lookup endpoint is tried first; if it is unavailable the
+        details are fetched concurrently one animal at a time.
+        
+        Args:
+            client: API client instance
+            animal_ids: IDs of the animals to look up
+            emit: Callable receiving each successfully fetched AnimalDetail
+        """
+        if config.ENABLE_DETAIL_BATCH:
+            animal_details = self._extract_animal_details_batch(client, animal_ids)
+            if animal_details is not None:
+                for detail in animal_details:
+                    emit(detail)
+                return
+        
+        detailed_count = 0
         failed_count = 0
         
-        for animal_summary in animal_summaries:
-            try:
-                detail = client.get_animal_detail(animal_summary.id)
-                animal_details.append(detail)
-            except APIError as e:
-                logger.error(f"Failed to get details for animal {animal_summary.id}: {str(e)}")
+        def on_result(animal_id: int, result) -> None:
+            nonlocal detailed_count, failed_count
+            if isinstance(result, APIError):
+                logger.error(f"Failed to get details for animal {animal_id}: {str(result)}")
                 failed_count += 1
-                continue
+                return
+            detailed_count += 1
+            emit(result)
         
-        self.stats.total_animals_detailed = len(animal_details)
+        results = client.get_animal_details_by_id(animal_ids, return_exceptions=True, on_result=on_result)
+        
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, APIError):
+                raise result
+        
+        self.stats.total_animals_detailed = detailed_count
         self.stats.failed_details = failed_count
         
-        logger.info(f"Successfully extracted details for {len(animal_details)} animals "
+        logger.info(f"Successfully extracted details for {detailed_count} animals "
                    f"({failed_count} failed)")
+    
+    def _extract_animal_details_batch(self, client: AnimalAPIClient,
+                                      animal_ids: Sequence[int]) -> Optional[List[AnimalDetail]]:
+        """
+        Extract animal details through the batch lookup endpoint.
+        
+        Args:
+            client: API client instance
+            animal_ids: IDs of the animals to look up
+            
+        Returns:
+            List of animal details, or None if the batch path is unavailable
+            and the caller should fall back to per-animal requests
+        """
+        try:
+            animal_details = client.get_animal_details_batch(animal_ids)
+        except APIError as e:
+            logger.warning(f"Batch detail lookup failed, falling back to per-animal requests: {str(e)}")
+            return None
+        
+        if animal_details is None:
+            return None
+        
+        self.stats.total_animals_detailed = len(animal_details)
+        self.stats.failed_details = len(animal_ids) - len(animal_details)
+        
+        logger.info(f"Successfully extracted details for {len(animal_details)} animals "
+                   f"({self.stats.failed_details} failed)")
         return animal_details
     
     def transform_animals(self, animal_details: List[AnimalDetail]) -> List[TransformedAnimal]:
@@ -132,11 +232,10 @@ class AnimalETLProcessor:
         """
         logger.info("Starting animal transformation...")
         
-        initial_count = len(animal_details)
-        transformed_animals = transform_animals_batch(animal_details)
+        transformed_animals, errors = transform_animals_batch(animal_details, workers=config.TRANSFORM_WORKERS)
         
         self.stats.total_animals_transformed = len(transformed_animals)
-        self.stats.failed_transformations = initial_count - len(transformed_animals)
+        self.stats.failed_transformations = len(errors)
         
         logger.info(f"Successfully transformed {len(transformed_animals)} animals "
                    f"({self.stats.failed_transformations} failed)")
@@ -157,29 +256,47 @@ class AnimalETLProcessor:
         """
         logger.info(f"Starting to load {len(transformed_animals)} animals in batches of {self.batch_size}")
         
+        batches = (transformed_animals[i:i + self.batch_size]
+                   for i in range(0, len(transformed_animals), self.batch_size))
+        return self._submit_batches(client, batches)
+    
+    def _submit_batches(self, client: AnimalAPIClient, batches: Iterable[List[TransformedAnimal]]) -> bool:
+        """
+        Submit batches concurrently as they are produced and record load statistics.
+        
+        Args:
+            client: API client instance
+            batches: Iterable of batches, consumed lazily
+            
+        Returns:
+            True if all batches were submitted successfully
+        """
         total_submitted = 0
         failed_batches = 0
         batch_number = 0
 
-        for i in range(0, len(transformed_animals), self.batch_size):
-            batch_number += 1
-            batch = transformed_animals[i:i + self.batch_size]
-            
-            logger.info(f"Processing batch {batch_number}: {len(batch)} animals")
+        with ThreadPoolExecutor(max_workers=config.MAX_SUBMIT_WORKERS) as executor:
+            futures = {}
+            for batch in batches:
+                batch_number += 1
+                
+                logger.info(f"Processing batch {batch_number}: {len(batch)} animals")
+                futures[executor.submit(client.submit_animals_batch, batch)] = (batch_number, len(batch))
             
-            try:
-                success = client.submit_animals_batch(batch)
-                if success:
-                    total_submitted += len(batch)
-                    logger.info(f"Successfully submitted batch {batch_number}")
-                else:
-                    logger.error(f"Failed to submit batch {batch_number}")
+            for future in as_completed(futures):
+                number, size = futures[future]
+                try:
+                    success = future.result()
+                    if success:
+                        total_submitted += size
+                        logger.info(f"Successfully submitted batch {number}")
+                    else:
+                        logger.error(f"Failed to submit batch {number}")
+                        failed_batches += 1
+                        
+                except (APIError, ValueError) as e:
+                    logger.error(f"Error submitting batch {number}: {str(e)}")
                     failed_batches += 1
-                    
-            except (APIError, ValueError) as e:
-                logger.error(f"Error submitting batch {batch_number}: {str(e)}")
-                failed_batches += 1
-                continue
         
         self.stats.total_animals_submitted = total_submitted
         self.stats.total_batches_submitted = batch_number - failed_batches
@@ -189,6 +306,80 @@ class AnimalETLProcessor:
         
         return failed_batches == 0
     
+    def _run_pipeline(self, client: AnimalAPIClient, animal_ids: Sequence[int]) -> bool:
+        """
+        Fetch, transform and load animals as overlapping stages.
+        
+        Each detail is transformed as soon as it arrives and only the
+        transformed animal is queued, so no list of raw details is kept.
+        The queue is grouped into batches and submitted while later
+        details are still being fetched.
+        
+        Args:
+            client: API client instance
+            animal_ids: IDs of the animals to process
+            
+        Returns:
+            True if all batches were submitted successfully
+        """
+        transformed_queue = queue.Queue(maxsize=self.batch_size * 2)
+        
+        logger.info("Starting pipelined detail extraction, transformation and load...")
+        
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="etl-producer") as stages:
+            producer = stages.submit(self._produce_transformed, client, animal_ids, transformed_queue)
+            
+            batches = self._drain_batches(transformed_queue)
+            try:
+                load_success = self._submit_batches(client, batches)
+            finally:
+                # Keep the queue moving so the producer can finish if loading stopped early
+                for _ in batches:
+                    pass
+            
+            producer.result()
+        
+        return load_success
+    
+    def _produce_transformed(self, client: AnimalAPIClient, animal_ids: Sequence[int],
+                             transformed_queue: queue.Queue) -> None:
+        """Pipeline producer: fetch details, transform each on arrival and queue the result."""
+        errors: List[str] = []
+        
+        def transform_and_enqueue(detail: AnimalDetail) -> None:
+            transformed, error_msg = safe_transform_animal(detail)
+            if error_msg is not None:
+                errors.append(error_msg)
+                return
+            self.stats.total_animals_transformed += 1
+            transformed_queue.put(transformed)
+        
+        try:
+            self._stream_animal_details(client, animal_ids, transform_and_enqueue)
+        finally:
+            transformed_queue.put(_END_OF_STREAM)
+            self.stats.failed_transformations = len(errors)
+            if errors:
+                logger.warning("Failed to transform %d animals; first %d: %s",
+                               len(errors), min(len(errors), 5), errors[:5])
+        
+        logger.info(f"Successfully transformed {self.stats.total_animals_transformed} animals "
+                   f"({self.stats.failed_transformations} failed)")
+    
+    def _drain_batches(self, transformed_queue: queue.Queue) -> Iterator[List[TransformedAnimal]]:
+        """Pipeline stage 3 input: group transformed animals into batches of batch_size."""
+        batch = []
+        while True:
+            item = transformed_queue.get()
+            if item is _END_OF_STREAM:
+                break
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
     def run(self) -> bool:
         """
         Run the complete ETL process.
@@ -199,32 +390,30 @@ class AnimalETLProcessor:
         self.stats.start_time = time.time()
         logger.info("Starting Animal ETL process...")
         
+        if config.BORN_AT_CACHE_FILE:
+            load_born_at_cache(config.BORN_AT_CACHE_FILE)
+        
         try:
-            with AnimalAPIClient(self.base_url, self.timeout) as client:
-                # Extract animals
-                animal_summaries = self.extract_animals(client)
-                if not animal_summaries:
+            with AnimalAPIClient(self.base_url, self.timeout, self.max_retries) as client:
+                # Extract animal IDs
+                animal_ids = self.extract_animal_ids(client)
+                if not animal_ids:
                     logger.warning("No animals found to process")
                     return True
                 
-                # Extract animal details
-                animal_details = self.extract_animal_details(client, animal_summaries)
-                if not animal_details:
+                # Extract details, transform and load as one pipeline
+                load_success = self._run_pipeline(client, animal_ids)
+                
+                self.stats.end_time = time.time()
+                self._log_final_stats()
+                
+                if not self.stats.total_animals_detailed:
                     logger.error("No animal details could be extracted")
                     return False
-                
-                # Transform animals
-                transformed_animals = self.transform_animals(animal_details)
-                if not transformed_animals:
+                if not self.stats.total_animals_transformed:
                     logger.error("No animals could be transformed")
                     return False
                 
-                # Load animals
-                load_success = self.load_animals(client, transformed_animals)
-                
-                self.stats.end_time = time.time()
-                self._log_final_stats()
-                
                 return load_success
                 
         except Exception as e:
@@ -232,23 +421,30 @@ class AnimalETLProcessor:
             logger.error(f"ETL process failed with error: {str(e)}")
             self._log_final_stats()
             return False
+        finally:
+            if config.BORN_AT_CACHE_FILE:
+                save_born_at_cache(config.BORN_AT_CACHE_FILE)
     
     def _log_final_stats(self):
         """Log final statistics for the ETL process."""
-        logger.info("=" * 50)
-        logger.info("ETL PROCESS SUMMARY")
-        logger.info("=" * 50)
-        logger.info(f"Duration: {self.stats.duration_seconds:.2f} seconds")
-        logger.info(f"Animals found: {self.stats.total_animals_found}")
-        logger.info(f"Details extracted: {self.stats.total_animals_detailed} "
-                   f"(failed: {self.stats.failed_details})")
-        logger.info(f"Animals transformed: {self.stats.total_animals_transformed} "
-                   f"(failed: {self.stats.failed_transformations})")
-        logger.info(f"Animals submitted: {self.stats.total_animals_submitted}")
-        logger.info(f"Batches submitted: {self.stats.total_batches_submitted} "
-                   f"(failed: {self.stats.failed_submissions})")
-        logger.info(f"Overall success rate: {self.stats.success_rate:.1f}%")
-        logger.info("=" * 50)
+        stats = self.stats
+        duration = stats.duration_seconds
+        log = logger.info
+        log("=" * 50)
+        log("ETL PROCESS SUMMARY")
+        log("=" * 50)
+        # Dry runs never set end_time, so there may be no duration to report
+        log(f"Duration: {duration:.2f} seconds" if duration is not None else "Duration: n/a")
+        log(f"Animals found: {stats.total_animals_found}")
+        log(f"Details extracted: {stats.total_animals_detailed} "
+            f"(failed: {stats.failed_details})")
+        log(f"Animals transformed: {stats.total_animals_transformed} "
+            f"(failed: {stats.failed_transformations})")
+        log(f"Animals submitted: {stats.total_animals_submitted}")
+        log(f"Batches submitted: {stats.total_batches_submitted} "
+            f"(failed: {stats.failed_submissions})")
+        log(f"Overall success rate: {stats.success_rate:.1f}%")
+        log("=" * 50)
     
     def get_stats(self) -> ETLStats:
         """
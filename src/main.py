@@ -6,6 +6,7 @@ import click
 
 import config
 from etl_processor import AnimalETLProcessor
+from transformers import load_born_at_cache, save_born_at_cache
 
 def setup_logging(log_level: str = config.LOG_LEVEL):
     logging.basicConfig(
@@ -53,14 +54,17 @@ def cli(base_url: str, batch_size: int, max_retries: int, timeout: int,
 
 def run_dry_run(processor: AnimalETLProcessor) -> bool:
     logger = logging.getLogger(__name__)
+    if config.BORN_AT_CACHE_FILE:
+        load_born_at_cache(config.BORN_AT_CACHE_FILE)
     try:
         from api_client import AnimalAPIClient
-        with AnimalAPIClient(processor.base_url, processor.timeout) as client:
-            animal_summaries = processor.extract_animals(client)
-            if not animal_summaries:
+        with AnimalAPIClient(processor.base_url, processor.timeout, processor.max_retries,
+                             enable_cache=True) as client:
+            animal_ids = processor.extract_animal_ids(client)
+            if not animal_ids:
                 logger.warning("No animals found to process")
                 return True
-            animal_details = processor.extract_animal_details(client, animal_summaries)
+            animal_details = processor.extract_animal_details_by_id(client, animal_ids)
             transformed = processor.transform_animals(animal_details)
             logger.info(f"DRY RUN: {len(transformed)} animals processed")
             processor._log_final_stats()
@@ -68,6 +72,9 @@ def run_dry_run(processor: AnimalETLProcessor) -> bool:
     except Exception as e:
         logger.error(f"Dry run failed: {e}")
         return False
+    finally:
+        if config.BORN_AT_CACHE_FILE:
+            save_born_at_cache(config.BORN_AT_CACHE_FILE)
 
 if __name__ == '__main__':
     cli()
@@ -1,6 +1,6 @@
 from datetime import datetime
-from typing import List, Optional, Union
-from pydantic import BaseModel, Field, model_validator, validator
+from typing import Any, Dict, List, NamedTuple, Optional, Union
+from pydantic import BaseModel, Field, model_validator
 
 
 class AnimalSummary(BaseModel):
@@ -24,25 +24,39 @@ class AnimalDetail(BaseModel):
     class Config:
         extra = "allow" 
     
-    @validator('friends', pre=True, always=True)
-    def validate_friends(cls, v):
-        """Ensure friends is either a string or list of strings."""
-        if isinstance(v, str):
-            return v
-        if isinstance(v, list):
-            return [str(item) for item in v if item] 
-        if v is None:
-            return ""
-        return str(v)
-    
-    @validator('born_at', pre=True, always=True)
-    def validate_born_at(cls, v):
-        """Ensure born_at is either None, string, or datetime."""
-        if v is None or v == "":
-            return None
-        if isinstance(v, datetime):
-            return v
-        return str(v)
+    @model_validator(mode="before")
+    def normalize_fields(cls, values):
+        """
+        Normalize friends and born_at in one pass over the raw record.
+        
+        friends becomes a string or a list of non-empty strings (None -> "");
+        born_at becomes None, a string, or a datetime ("" -> None).
+        """
+        if not isinstance(values, dict):
+            return values
+        
+        friends = values.get('friends', "")
+        born_at = values.get('born_at')
+        
+        # Common case: both fields already have their final shape
+        if type(friends) is str and (born_at is None or (type(born_at) is str and born_at)):
+            return values
+        
+        values = dict(values)
+        if 'friends' in values and not isinstance(friends, str):
+            if isinstance(friends, list):
+                values['friends'] = [str(item) for item in friends if item]
+            elif friends is None:
+                values['friends'] = ""
+            else:
+                values['friends'] = str(friends)
+        
+        if born_at == "":
+            values['born_at'] = None
+        elif born_at is not None and not isinstance(born_at, (str, datetime)):
+            values['born_at'] = str(born_at)
+        
+        return values
 
 
 class TransformedAnimal(BaseModel):
@@ -73,13 +87,23 @@ class PaginatedResponse(BaseModel):
         return values
 
 
+class RawPage(NamedTuple):
+    """Unvalidated page from the list endpoint, with items left as decoded dicts."""
+    
+    page: int
+    total_pages: int
+    items: List[Dict[str, Any]]
+
+
 class APIError(Exception):
     """Custom exception for API-related errors."""
     
-    def __init__(self, message: str, status_code: Optional[int] = None, response_text: Optional[str] = None):
+    def __init__(self, message: str, status_code: Optional[int] = None, response_text: Optional[str] = None,
+                 retry_after: Optional[float] = None):
         self.message = message
         self.status_code = status_code
         self.response_text = response_text
+        self.retry_after = retry_after
         super().__init__(self.message)
 
 
@@ -1,12 +1,271 @@
+import json
 import logging
-from datetime import datetime
-from typing import List, Optional
-from dateutil import parser, tz
+import os
+import re
+from calendar import isleap
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple, cast
+from dateutil import parser
+
+try:
+    from ciso8601 import parse_datetime
+except ImportError:  # optional dependency, dateutil handles every string without it
+    parse_datetime = None
 
 from models import AnimalDetail, TransformedAnimal, TransformationError
 
 logger = logging.getLogger(__name__)
 
+# Stdlib UTC singleton; dateutil's tz.UTC is an extra attribute lookup per call
+_UTC = timezone.utc
+_ZERO = timedelta(0)
+
+# Common born_at layouts, tried in order before dateutil's format sniffing
+_FAST_FORMATS = (
+    '%Y-%m-%dT%H:%M:%S%z',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d',
+)
+
+# Below this many distinct born_at strings, process start-up costs more than it saves
+_PARALLEL_MIN_VALUES = 500
+
+# Default for transform_animal's born_at: parse animal.born_at itself
+_PARSE_BORN_AT = object()
+
+# Splits on commas and swallows the whitespace around them in the same pass
+_FRIENDS_SPLIT = re.compile(r'\s*,\s*')
+
+
+def _to_utc(dt: datetime) -> datetime:
+    """Return dt as an aware UTC datetime, treating naive values as UTC already."""
+    tzinfo = dt.tzinfo
+    if tzinfo is None:
+        return dt.replace(tzinfo=_UTC)
+    if tzinfo is _UTC or dt.utcoffset() == _ZERO:
+        # Already at offset zero, which formats the same as UTC
+        return dt
+    return dt.astimezone(_UTC)
+
+
+# Longest month lengths, with February's leap day checked separately
+_DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Fixed-offset tzinfo singletons keyed by offset in minutes; there are at most a few thousand
+_TZ_CACHE: Dict[int, timezone] = {0: _UTC}
+
+
+def _tz_for(offset_minutes: int) -> timezone:
+    """Return a shared fixed-offset timezone for an offset in (-1440, 1440) minutes."""
+    tzinfo = _TZ_CACHE.get(offset_minutes)
+    if tzinfo is None:
+        tzinfo = _TZ_CACHE[offset_minutes] = timezone(timedelta(minutes=offset_minutes))
+    return tzinfo
+
+
+def _scan_iso_fixed(value: str) -> Optional[Tuple[int, int, int, int, int, int, Optional[int]]]:
+    """
+    Scan a fixed-width ISO 8601 string by slicing at known offsets.
+
+    Accepts YYYY-MM-DD and YYYY-MM-DDTHH:MM:SS, the latter optionally followed
+    by Z or +HH:MM/-HH:MM. Returns (year, month, day, hour, minute, second,
+    offset in minutes or None when naive), or None for any other shape or an
+    out-of-range field, leaving those to the general parsers.
+    """
+    n = len(value)
+    if n < 10 or value[4] != '-' or value[7] != '-':
+        return None
+    
+    if n == 10:
+        digits = value[0:4] + value[5:7] + value[8:10] + '000000'
+        offset_minutes = None
+    else:
+        if n < 19 or value[10] not in 'Tt ' or value[13] != ':' or value[16] != ':':
+            return None
+        
+        suffix = value[19:]
+        if not suffix:
+            offset_minutes = None
+        elif suffix == 'Z' or suffix == 'z':
+            offset_minutes = 0
+        elif len(suffix) == 6 and suffix[0] in '+-' and suffix[3] == ':':
+            offset_digits = suffix[1:3] + suffix[4:6]
+            if not (offset_digits.isascii() and offset_digits.isdigit()):
+                return None
+            offset_minutes = int(suffix[1:3]) * 60 + int(suffix[4:6])
+            if offset_minutes >= 1440:
+                return None
+            if suffix[0] == '-':
+                offset_minutes = -offset_minutes
+        else:
+            return None
+        
+        digits = value[0:4] + value[5:7] + value[8:10] + value[11:13] + value[14:16] + value[17:19]
+    
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    # One int() over all the digits, then split arithmetically
+    date_part, time_part = divmod(int(digits), 1000000)
+    year, month_day = divmod(date_part, 10000)
+    month, day = divmod(month_day, 100)
+    hour, minute_second = divmod(time_part, 10000)
+    minute, second = divmod(minute_second, 100)
+    
+    # Same bounds datetime() enforces, checked here so callers can skip building one
+    if not (year >= 1 and 1 <= month <= 12 and 1 <= day <= _DAYS_IN_MONTH[month]
+            and hour < 24 and minute < 60 and second < 60):
+        return None
+    if month == 2 and day == 29 and not isleap(year):
+        return None
+    return year, month, day, hour, minute, second, offset_minutes
+
+
+def _parse_iso_fixed(value: str) -> Optional[datetime]:
+    """Parse a fixed-width ISO 8601 string (see _scan_iso_fixed) into a datetime, or None."""
+    fields = _scan_iso_fixed(value)
+    if fields is None:
+        return None
+    offset_minutes = fields[6]
+    tzinfo = None if offset_minutes is None else _tz_for(offset_minutes)
+    return datetime(*fields[:6], tzinfo=tzinfo)
+
+
+def _iso_fixed_to_utc_str(value: str) -> Optional[str]:
+    """
+    Format a fixed-width ISO 8601 string already at UTC (or naive) straight to the output shape.
+
+    The validated input is re-sliced into datetime.isoformat()'s layout, so no
+    datetime is built. Returns None for other offsets or shapes.
+    """
+    fields = _scan_iso_fixed(value)
+    if fields is None or fields[6]:
+        return None
+    if len(value) == 10:
+        return value + 'T00:00:00+00:00'
+    return value[0:10] + 'T' + value[11:19] + '+00:00'
+
+
+def _parse_datetime_str(value: str) -> datetime:
+    """
+    Parse a date string, trying ciso8601 (or the fixed-width scanner and strptime formats)
+    before dateutil's format sniffing.
+
+    Raises:
+        ValueError: If dateutil cannot parse the value either
+        OverflowError: If the value is numeric and out of range for dateutil
+    """
+    if parse_datetime is not None:
+        try:
+            return parse_datetime(value)
+        except ValueError:
+            pass
+    else:
+        # Without ciso8601, the common fixed-width shape is sliced directly,
+        # and the other formats the API emits are still cheaper via strptime
+        parsed = _parse_iso_fixed(value)
+        if parsed is not None:
+            return parsed
+        for fmt in _FAST_FORMATS:
+            try:
+                return datetime.strptime(value, fmt)
+            except ValueError:
+                continue
+    return parser.parse(value)
+
+
+# born_at values cluster on a small set of dates, so parsed strings repeat heavily
+_BORN_AT_CACHE_SIZE = 2 ** 17
+
+
+# Parsed born_at values shared with other runs; None until load_born_at_cache() enables it
+_persisted_born_at: Optional[Dict[str, str]] = None
+
+
+def load_born_at_cache(path: str) -> int:
+    """
+    Load born_at values parsed by earlier runs and start recording new ones.
+
+    A missing or unreadable file starts an empty cache.
+
+    Args:
+        path: JSON file written by save_born_at_cache
+
+    Returns:
+        Number of values loaded
+    """
+    global _persisted_born_at
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        data = {}
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable born_at cache %s: %s", path, e)
+        data = {}
+    if not isinstance(data, dict):
+        logger.warning("Ignoring born_at cache %s: expected a JSON object", path)
+        data = {}
+    _persisted_born_at = data
+    logger.info("Loaded %d cached born_at values from %s", len(data), path)
+    return len(data)
+
+
+def save_born_at_cache(path: str) -> None:
+    """
+    Write the recorded born_at values to path for the next run.
+
+    Does nothing unless load_born_at_cache() was called. The file is replaced
+    atomically, so an interrupted save leaves the previous cache intact.
+
+    Args:
+        path: JSON file to write
+    """
+    if _persisted_born_at is None:
+        return
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(_persisted_born_at, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Failed to save born_at cache to %s: %s", path, e)
+        return
+    logger.info("Saved %d cached born_at values to %s", len(_persisted_born_at), path)
+
+
+@lru_cache(maxsize=_BORN_AT_CACHE_SIZE)
+def _parse_born_at_str(value: str) -> str:
+    """
+    Parse a born_at string into an ISO8601 UTC timestamp, memoised by value.
+
+    Misses fall back to the values persisted from earlier runs, when enabled.
+    Failures are not cached; the parser's exception reaches the caller.
+    """
+    persisted = _persisted_born_at
+    if persisted is not None:
+        utc_str = persisted.get(value)
+        if utc_str is not None:
+            return utc_str
+    
+    utc_str = _iso_fixed_to_utc_str(value)
+    if utc_str is None:
+        utc_str = _to_utc(_parse_datetime_str(value)).isoformat()
+    if persisted is not None:
+        persisted[value] = utc_str
+    return utc_str
+
+
+def _strict_born_at_str(value: str) -> Optional[str]:
+    """Parse a born_at string like _parse_born_at_str, returning None instead of raising."""
+    try:
+        return _parse_born_at_str(value)
+    except (ValueError, OverflowError):
+        return None
+
+
 def safe_transform_born_at(born_at_val) -> Optional[str]:
     """
     Safely transform born_at field to ISO8601 UTC timestamp.
@@ -25,22 +284,12 @@ def safe_transform_born_at(born_at_val) -> Optional[str]:
     try:
         # datetime object
         if isinstance(born_at_val, datetime):
-            dt = born_at_val
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=tz.UTC)
-            else:
-                dt = dt.astimezone(tz.UTC)
-            return dt.isoformat()
+            return _to_utc(born_at_val).isoformat()
 
         # string
         if isinstance(born_at_val, str):
             try:
-                dt = parser.parse(born_at_val)
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=tz.UTC)
-                else:
-                    dt = dt.astimezone(tz.UTC)
-                return dt.isoformat()
+                return _parse_born_at_str(born_at_val)
             except (ValueError, parser.ParserError):
                 born_at_val = int(born_at_val)
 
@@ -48,11 +297,11 @@ def safe_transform_born_at(born_at_val) -> Optional[str]:
         if isinstance(born_at_val, (int, float)):
             if born_at_val > 1e12:
                 born_at_val = born_at_val / 1000
-            dt = datetime.utcfromtimestamp(born_at_val).replace(tzinfo=tz.UTC)
+            dt = datetime.utcfromtimestamp(born_at_val).replace(tzinfo=_UTC)
             return dt.isoformat()
 
     except Exception as e:
-        logger.warning(f"Invalid born_at value '{born_at_val}', setting to None: {e}")
+        logger.warning("Invalid born_at value '%s', setting to None: %s", born_at_val, e)
         return None
 
 
@@ -67,23 +316,20 @@ def transform_friends(friends_str: str) -> List[str]:
         List of friend names, empty list if input is empty/None
         
     Raises:
-        TransformationError: If transformation fails
+        TransformationError: If friends_str is not a string
     """
-    if not friends_str or friends_str.strip() == "":
+    if not friends_str:
         return []
-
-    try:
-        # Split by comma and clean up whitespace
-        friends_list = [friend.strip() for friend in friends_str.split(",")]
-        # Filter out empty strings
-        friends_list = [friend for friend in friends_list if friend]
-        return friends_list
-    except Exception as e:
+    if not isinstance(friends_str, str):
         raise TransformationError(
-            f"Failed to transform friends field: {str(e)}",
+            f"Failed to transform friends field: expected str, got {type(friends_str).__name__}",
             field="friends"
         )
 
+    # Split by comma, trimming whitespace, and drop empty entries;
+    # a whitespace-only string strips to "" and is filtered out here too
+    return [friend for friend in _FRIENDS_SPLIT.split(friends_str.strip()) if friend]
+
 
 def transform_born_at(born_at_val) -> Optional[str]:
     """
@@ -100,22 +346,14 @@ def transform_born_at(born_at_val) -> Optional[str]:
 
     # If it's a datetime object
     if isinstance(born_at_val, datetime):
-        if born_at_val.tzinfo is None:
-            return born_at_val.replace(tzinfo=tz.UTC).isoformat()
-        else:
-            return born_at_val.astimezone(tz.UTC).isoformat()
+        return _to_utc(born_at_val).isoformat()
 
     if isinstance(born_at_val, str) and born_at_val.strip() == "":
         return None
 
     try:
         # Parse string and convert to UTC
-        parsed_date = parser.parse(born_at_val)
-        if parsed_date.tzinfo is None:
-            utc_date = parsed_date.replace(tzinfo=tz.UTC)
-        else:
-            utc_date = parsed_date.astimezone(tz.UTC)
-        return utc_date.isoformat()
+        return _parse_born_at_str(born_at_val)
 
     except (ValueError, parser.ParserError) as e:
         raise TransformationError(
@@ -123,12 +361,16 @@ def transform_born_at(born_at_val) -> Optional[str]:
             field="born_at"
         )
 
-def transform_animal(animal: AnimalDetail) -> TransformedAnimal:
+def transform_animal(animal: AnimalDetail, born_at: Any = _PARSE_BORN_AT,
+                     validate: bool = False) -> TransformedAnimal:
     """
     Transform an AnimalDetail into a TransformedAnimal ready for submission.
     
     Args:
         animal: AnimalDetail instance to transform
+        born_at: Already-transformed born_at to use instead of parsing animal.born_at
+        validate: Run TransformedAnimal's validation on the result instead of
+            constructing it directly from the already-validated fields
         
     Returns:
         TransformedAnimal instance with transformed fields
@@ -136,29 +378,52 @@ def transform_animal(animal: AnimalDetail) -> TransformedAnimal:
     Raises:
         TransformationError: If any transformation fails
     """
-    logger.debug(f"Transforming animal {animal.id}: {animal.name}")
+    logger.debug("Transforming animal %s: %s", animal.id, animal.name)
     
     try:
-        # Transform friends field
-        if isinstance(animal.friends, list):
-            transformed_friends = animal.friends
+        # Transform friends field; the model only ever holds a plain str or list here
+        friends = animal.friends
+        if type(friends) is list:
+            transformed_friends = friends
         else:
-            transformed_friends = transform_friends(animal.friends)
+            transformed_friends = transform_friends(friends)
         
         # Transform born_at field
-        transformed_born_at = safe_transform_born_at(animal.born_at)
+        if born_at is not _PARSE_BORN_AT:
+            transformed_born_at = born_at
+        else:
+            born_at = animal.born_at
+            if born_at is None:
+                transformed_born_at = None
+            elif isinstance(born_at, datetime):
+                # Inline UTC normalisation; skips safe_transform_born_at's dispatch for datetimes
+                tzinfo = born_at.tzinfo
+                if tzinfo is _UTC:
+                    transformed_born_at = born_at.isoformat()
+                elif tzinfo is None:
+                    transformed_born_at = born_at.replace(tzinfo=_UTC).isoformat()
+                else:
+                    try:
+                        transformed_born_at = born_at.astimezone(_UTC).isoformat()
+                    except (OverflowError, ValueError):
+                        # Out of range once shifted to UTC; keep the animal with born_at=None
+                        transformed_born_at = safe_transform_born_at(born_at)
+            else:
+                transformed_born_at = safe_transform_born_at(born_at)
             
-        # Create the transformed animal
-        transformed = TransformedAnimal(
+        # Create the transformed animal. The input was validated as an AnimalDetail and the
+        # transforms above only yield str / List[str] / None, so validation is opt-in.
+        build = TransformedAnimal if validate else TransformedAnimal.model_construct
+        transformed = build(
             id=animal.id,
             name=animal.name,
             friends=transformed_friends,
             born_at=transformed_born_at,
-            **{k: v for k, v in animal.dict().items() 
-               if k not in ['id', 'name', 'friends', 'born_at']}
+            # Undeclared fields live in the extras dict; pass them on without dumping the model
+            **(animal.__pydantic_extra__ or {})
         )
         
-        logger.debug(f"Successfully transformed animal {animal.id}")
+        logger.debug("Successfully transformed animal %s", animal.id)
         return transformed
         
     except TransformationError:
@@ -171,37 +436,96 @@ def transform_animal(animal: AnimalDetail) -> TransformedAnimal:
         )
 
 
-def transform_animals_batch(animals: List[AnimalDetail]) -> List[TransformedAnimal]:
+def safe_transform_animal(animal: AnimalDetail,
+                          born_at: Any = _PARSE_BORN_AT) -> Tuple[Optional[TransformedAnimal], Optional[str]]:
+    """
+    Transform a single animal without raising.
+    
+    Args:
+        animal: AnimalDetail instance to transform
+        born_at: Already-transformed born_at, as for transform_animal
+        
+    Returns:
+        (TransformedAnimal, None) on success, or (None, error message) on failure
+    """
+    try:
+        return transform_animal(animal, born_at), None
+    except TransformationError as e:
+        return None, f"Failed to transform animal {animal.id}: {e.message}"
+    except Exception as e:
+        return None, f"Unexpected error transforming animal {animal.id}: {str(e)}"
+
+
+def transform_animals_batch(animals: List[AnimalDetail],
+                            workers: Optional[int] = None) -> Tuple[List[TransformedAnimal], List[str]]:
     """
     Transform a batch of animals, collecting any transformation errors.
     
     Args:
         animals: List of AnimalDetail instances to transform
+        workers: Number of worker processes for parsing born_at in large batches;
+            None or 0 does everything in this process
         
     Returns:
-        List of successfully transformed animals
+        Tuple of (successfully transformed animals, error messages for the failures)
         
     Note:
-        Logs errors for failed transformations but continues processing
+        Failures are summarised in one warning at the end rather than logged
+        one by one; the full messages are in the returned error list
     """
-    transformed_animals = []
-    errors = []
+    # Sized up front and trimmed afterwards, so the loop never has to grow the list
+    transformed_animals: List[Optional[TransformedAnimal]] = [None] * len(animals)
+    count = 0
+    errors: List[str] = []
     
-    for animal in animals:
-        try:
-            transformed = transform_animal(animal)
-            transformed_animals.append(transformed)
-        except TransformationError as e:
-            error_msg = f"Failed to transform animal {animal.id}: {e.message}"
-            logger.error(error_msg)
-            errors.append(error_msg)
-        except Exception as e:
-            error_msg = f"Unexpected error transforming animal {animal.id}: {str(e)}"
-            logger.error(error_msg)
+    for transformed, error_msg in _transform_results(animals, workers):
+        if error_msg is None:
+            transformed_animals[count] = transformed
+            count += 1
+        else:
             errors.append(error_msg)
+    del transformed_animals[count:]
     
     if errors:
-        logger.warning(f"Failed to transform {len(errors)} out of {len(animals)} animals")
+        logger.warning("Failed to transform %d out of %d animals; first %d: %s",
+                       len(errors), len(animals), min(len(errors), 5), errors[:5])
+    
+    logger.info("Successfully transformed %d out of %d animals", len(transformed_animals), len(animals))
+    # Every slot left after the trim holds a transformed animal
+    return cast(List[TransformedAnimal], transformed_animals), errors
+
+
+def _transform_results(animals: List[AnimalDetail],
+                       workers: Optional[int]) -> Iterator[Tuple[Optional[TransformedAnimal], Optional[str]]]:
+    """
+    Yield safe_transform_animal results for animals, in order.
+
+    Each distinct born_at string in the batch is parsed once and shared. With
+    workers, large sets of distinct strings are parsed across processes; only
+    the strings and their ISO results cross the process boundary, and the
+    cheap per-animal assembly stays in this process.
+    """
+    born_at_by_value: Dict[str, Optional[str]] = {}
+    if workers:
+        distinct = list({animal.born_at for animal in animals if type(animal.born_at) is str})
+        if len(distinct) > _PARALLEL_MIN_VALUES:
+            chunksize = max(1, len(distinct) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parsed = executor.map(_strict_born_at_str, distinct, chunksize=chunksize)
+                # Values the strict parser rejects are left to safe_transform_born_at below,
+                # which adds the epoch fallback and logs the warning in this process
+                born_at_by_value = {value: utc_str for value, utc_str in zip(distinct, parsed)
+                                    if utc_str is not None}
+            # Workers' lru_cache and persisted map die with them; keep the strict results here
+            if _persisted_born_at is not None:
+                _persisted_born_at.update(born_at_by_value)
     
-    logger.info(f"Successfully transformed {len(transformed_animals)} out of {len(animals)} animals")
-    return transformed_animals
\ No newline at end of file
+    transform = safe_transform_animal
+    for animal in animals:
+        born_at = animal.born_at
+        if type(born_at) is str:
+            if born_at not in born_at_by_value:
+                born_at_by_value[born_at] = safe_transform_born_at(born_at)
+            yield transform(animal, born_at_by_value[born_at])
+        else:
+            yield transform(animal)
@@ -0,0 +1,109 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+import config
+from api_client import AnimalAPIClient
+from models import AnimalDetail, APIError
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Serves list pages from the server's ``pages`` dict; a page may be raw bytes to send as-is."""
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        page = int(query.get('page', ['1'])[0])
+        body = self.server.pages.get(page)
+        if body is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if isinstance(body, dict):
+            body = json.dumps(body).encode()
+        self.server.hits += 1
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        # Truncated pages advertise more than they send
+        self.send_header('Content-Length', str(self.server.content_length.get(page, len(body))))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+    server.pages = {}
+    server.content_length = {}
+    server.hits = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def streaming(monkeypatch):
+    pytest.importorskip('ijson')
+    monkeypatch.setattr(config, 'STREAM_PAGE_PARSING', True)
+    monkeypatch.setattr(config, 'STRICT_PAGE_VALIDATION', False)
+
+
+def _client(server, **kwargs):
+    return AnimalAPIClient(f"http://127.0.0.1:{server.server_address[1]}", timeout=5, max_retries=0, **kwargs)
+
+
+def _page(ids, total_pages=1):
+    return {'page': 1, 'total_pages': total_pages, 'items': [{'id': i, 'name': f"Animal {i}"} for i in ids]}
+
+
+def test_streamed_page_ids(stub_server, streaming):
+    stub_server.pages[1] = _page([1, 2, 3], total_pages=4)
+    with _client(stub_server) as client:
+        total_pages, ids = client._get_page_ids(1)
+    assert total_pages == 4
+    assert list(ids) == [1, 2, 3]
+
+
+def test_cached_page_reads_repeatedly(stub_server, streaming, monkeypatch, tmp_path):
+    pytest.importorskip('requests_cache')
+    monkeypatch.setattr(config, 'HTTP_CACHE_NAME', str(tmp_path / 'cache'))
+    stub_server.pages[1] = _page([1, 2, 3])
+    for _ in range(2):
+        with _client(stub_server, enable_cache=True) as client:
+            assert list(client._get_page_ids(1)[1]) == [1, 2, 3]
+    assert stub_server.hits == 1
+
+
+def test_streamed_non_integer_id_is_rejected(stub_server, streaming):
+    stub_server.pages[1] = _page([1, 5.9])
+    with _client(stub_server) as client:
+        with pytest.raises(APIError, match="Invalid response format"):
+            client._get_page_ids(1)
+
+
+def test_streamed_truncated_page_raises_api_error(stub_server, streaming):
+    body = json.dumps(_page([1, 2, 3])).encode()
+    stub_server.pages[1] = body[:20]
+    stub_server.content_length[1] = len(body)
+    with _client(stub_server) as client:
+        with pytest.raises(APIError):
+            client._get_page_ids(1)
+
+
+def test_detail_cache_evicts_least_recently_used(stub_server, monkeypatch):
+    monkeypatch.setattr(config, 'DETAIL_CACHE_SIZE', 2)
+    with _client(stub_server) as client:
+        for animal_id in (1, 2):
+            client._remember_detail(animal_id, AnimalDetail(id=animal_id, name=f"Animal {animal_id}", friends=""))
+        assert client._cached_detail(1) is not None
+        client._remember_detail(3, AnimalDetail(id=3, name="Animal 3", friends=""))
+        assert client._cached_detail(2) is None
+        assert [client._cached_detail(i).id for i in (1, 3)] == [1, 3]
@@ -0,0 +1,150 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from dateutil.parser import isoparse
+
+import transformers
+from models import AnimalDetail, TransformationError
+from transformers import (_iso_fixed_to_utc_str, _parse_born_at_str, _parse_iso_fixed, _scan_iso_fixed,
+                          safe_transform_born_at, transform_animal, transform_animals_batch,
+                          transform_born_at)
+
+
+def _reference_utc_str(value):
+    """dateutil's reading of value normalised to UTC isoformat, or None if it rejects it."""
+    try:
+        parsed = isoparse(value)
+    except (ValueError, OverflowError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat()
+
+
+def _scanner_utc_str(value):
+    """What the fixed-width fast path produces for value, or None if it declines."""
+    direct = _iso_fixed_to_utc_str(value)
+    if direct is not None:
+        return direct
+    parsed = _parse_iso_fixed(value)
+    if parsed is None:
+        return None
+    return transformers._to_utc(parsed).isoformat()
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2020-02-29", "2020-02-29T00:00:00+00:00"),
+    ("2000-02-29T12:00:00Z", "2000-02-29T12:00:00+00:00"),
+    ("2020-01-01T10:00:00Z", "2020-01-01T10:00:00+00:00"),
+    ("2020-01-01T10:00:00z", "2020-01-01T10:00:00+00:00"),
+    ("2020-01-01t10:00:00Z", "2020-01-01T10:00:00+00:00"),
+    ("2020-01-01 10:00:00", "2020-01-01T10:00:00+00:00"),
+    ("2020-01-01T10:00:00", "2020-01-01T10:00:00+00:00"),
+    ("2020-01-01T10:00:00-00:00", "2020-01-01T10:00:00+00:00"),
+    ("2020-01-01T10:00:00+02:00", "2020-01-01T08:00:00+00:00"),
+    ("2020-01-01T23:59:58-05:30", "2020-01-02T05:29:58+00:00"),
+    ("2020-01-01T00:00:00+23:59", "2019-12-31T00:01:00+00:00"),
+    ("0001-01-01", "0001-01-01T00:00:00+00:00"),
+])
+def test_scanner_accepts_fixed_width_iso(value, expected):
+    assert _scanner_utc_str(value) == expected
+    assert _parse_born_at_str(value) == expected
+
+
+@pytest.mark.parametrize("value", [
+    "2019-02-29",
+    "1900-02-29T00:00:00Z",
+    "2020-04-31",
+    "2020-00-10",
+    "2020-13-01T00:00:00Z",
+    "2020-01-00",
+    "2020-01-32",
+    "0000-01-01",
+    "2020-01-01T24:00:00",
+    "2020-01-01T10:60:00",
+    "2020-01-01T10:00:60",
+    "2020-01-01T10:00:00+24:00",
+    "2020-01-01T10:00:00+0200",
+    "2020-01-01T10:00:00.123Z",
+    "2020-01-01T10:00:00.5",
+    "2020-1-01",
+    "+020-01-01",
+    "2020-01-01X10:00:00",
+    "2020-０1-01",
+    "Jan 3 2020",
+    "1600432000000",
+])
+def test_scanner_declines_other_shapes_and_out_of_range(value):
+    assert _scan_iso_fixed(value) is None
+    assert _iso_fixed_to_utc_str(value) is None
+
+
+@pytest.mark.parametrize("value", [
+    "2020-01-01T10:00:00.123Z",
+    "2020-01-01T10:00:00.5+02:00",
+    "2020-01-01T24:00:00",
+])
+def test_declined_values_fall_through_to_general_parsers(value):
+    assert _parse_born_at_str(value) == _reference_utc_str(value)
+
+
+def test_scanner_matches_dateutil_on_random_inputs():
+    rng = random.Random(20201015)
+    suffixes = ["", "Z", "z", "+05:30", "-00:00", "-11:45", "+23:59", "+24:00"]
+    values = []
+    for _ in range(5000):
+        date = f"{rng.randint(0, 9999):04d}-{rng.randint(0, 13):02d}-{rng.randint(0, 32):02d}"
+        values.append(date)
+        time = f"{rng.randint(0, 25):02d}:{rng.randint(0, 61):02d}:{rng.randint(0, 61):02d}"
+        values.append(date + rng.choice("Tt ") + time + rng.choice(suffixes))
+    
+    for value in values:
+        expected = _reference_utc_str(value)
+        actual = _scanner_utc_str(value)
+        if expected is None:
+            assert actual is None, value
+        else:
+            # The scanner may decline a value dateutil accepts (e.g. 24:00), never disagree on one
+            assert actual in (None, expected), value
+
+
+@pytest.fixture
+def born_at_cache(monkeypatch, tmp_path):
+    """A fresh persisted born_at cache backed by a temporary file."""
+    monkeypatch.setattr(transformers, "_persisted_born_at", None)
+    _parse_born_at_str.cache_clear()
+    yield str(tmp_path / "born_at.json")
+    _parse_born_at_str.cache_clear()
+
+
+def test_born_at_cache_round_trip_keeps_only_strict_parses(born_at_cache):
+    iso_values = [f"2020-01-{day:02d}T{hour:02d}:{minute:02d}:00+01:00"
+                  for day in range(1, 4) for hour in range(24) for minute in range(0, 60, 10)]
+    epoch_values = [str(1600000000 + i) for i in range(100)]
+    animals = [AnimalDetail(id=i, name="x", friends="", born_at=value)
+               for i, value in enumerate(iso_values + epoch_values)]
+
+    transformers.load_born_at_cache(born_at_cache)
+    transformed, errors = transform_animals_batch(animals, workers=2)
+    assert not errors
+    # Epoch strings still transform through safe_transform_born_at's fallback
+    assert transformed[len(iso_values)].born_at == "2020-09-13T12:26:40+00:00"
+    transformers.save_born_at_cache(born_at_cache)
+
+    transformers._persisted_born_at = None
+    _parse_born_at_str.cache_clear()
+    assert transformers.load_born_at_cache(born_at_cache) == len(iso_values)
+    assert transformers._persisted_born_at[iso_values[0]] == "2019-12-31T23:00:00+00:00"
+    with pytest.raises(TransformationError):
+        transform_born_at("1600000007")
+
+
+@pytest.mark.parametrize("born_at", [
+    datetime(1, 1, 1, tzinfo=timezone(timedelta(hours=5))),
+    datetime(9999, 12, 31, 23, tzinfo=timezone(timedelta(hours=-5))),
+])
+def test_transform_animal_keeps_animal_when_datetime_overflows_utc(born_at):
+    animal = AnimalDetail(id=1, name="x", friends="", born_at=born_at)
+    assert transform_animal(animal).born_at is None
+    assert transform_animal(animal).born_at == safe_transform_born_at(born_at)